@@ -23,6 +23,11 @@ const GENRE_MAPPING = {
   10752: 10768
 };
 
+/**
+ * BUSINESS LOGIC: Western languages accepted by the quality gate
+ */
+const WESTERN_LANGUAGES = new Set(['en', 'es', 'fr', 'it', 'de', 'pt']);
+
 class EnhancedTMDBClient {
   constructor() {
     this.apiKey = process.env.TMDB_API_KEY || '';
@@ -344,8 +349,7 @@ class EnhancedTMDBClient {
       return false;
     }
 
-    const westernLanguages = ['en', 'es', 'fr', 'it', 'de', 'pt'];
-    if (!item.original_language || !westernLanguages.includes(item.original_language)) {
+    if (!item.original_language || !WESTERN_LANGUAGES.has(item.original_language)) {
       console.warn(`❌ BUSINESS LOGIC REJECTED: Item ${item.id} has non-western language: ${item.original_language}`);
       return false;
     }
@@ -558,8 +562,7 @@ class ContentFilterService {
       return null;
     }
     
-    const westernLanguages = ['en', 'es', 'fr', 'it', 'de', 'pt'];
-    if (!westernLanguages.includes(tmdbItem.original_language)) {
+    if (!WESTERN_LANGUAGES.has(tmdbItem.original_language)) {
       console.log(`❌ QUALITY GATE REJECT: Non-western language "${tmdbItem.original_language}" for item ${tmdbItem.id}`);
       return null;
     }
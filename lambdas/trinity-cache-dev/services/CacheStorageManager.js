@@ -488,8 +488,16 @@ class CacheStorageManager {
       const expectedIndexes = Array.from({ length: this.MOVIES_PER_ROOM }, (_, i) => i);
       const actualIndexes = movies.map(m => m.sequenceIndex).sort((a, b) => a - b);
       
-      const missingIndexes = expectedIndexes.filter(i => !actualIndexes.includes(i));
-      const duplicateIndexes = actualIndexes.filter((index, pos) => actualIndexes.indexOf(index) !== pos);
+      const seenIndexes = new Set();
+      const duplicateIndexes = [];
+      for (const index of actualIndexes) {
+        if (seenIndexes.has(index)) {
+          duplicateIndexes.push(index);
+        } else {
+          seenIndexes.add(index);
+        }
+      }
+      const missingIndexes = expectedIndexes.filter(i => !seenIndexes.has(i));
 
       if (missingIndexes.length > 0 || duplicateIndexes.length > 0) {
         return {
@@ -951,8 +959,16 @@ class CacheStorageManager {
       const sequenceIndexes = existingMovies.map(m => m.sequenceIndex).sort((a, b) => a - b);
       const expectedIndexes = Array.from({ length: this.MOVIES_PER_ROOM }, (_, i) => i);
       
-      const missingIndexes = expectedIndexes.filter(i => !sequenceIndexes.includes(i));
-      const duplicateIndexes = sequenceIndexes.filter((index, pos) => sequenceIndexes.indexOf(index) !== pos);
+      const seenIndexes = new Set();
+      const duplicateIndexes = [];
+      for (const index of sequenceIndexes) {
+        if (seenIndexes.has(index)) {
+          duplicateIndexes.push(index);
+        } else {
+          seenIndexes.add(index);
+        }
+      }
+      const missingIndexes = expectedIndexes.filter(i => !seenIndexes.has(i));
 
       return {
         success: false,
@@ -315,6 +315,7 @@ class MovieBatchLoader {
    */
   async fetchMoviesWithGenres(genreIds, mediaType, excludeIds = [], limit = 60) {
     try {
+      const excludeSet = new Set(excludeIds);
       const endpoint = mediaType === 'MOVIE' ? 'movie' : 'tv';
       const movies = [];
       let page = 1;
@@ -338,7 +339,7 @@ class MovieBatchLoader {
 
         // Filter out excluded movies
         const filteredMovies = pageMovies.filter(movie => 
-          !excludeIds.includes(movie.id.toString())
+          !excludeSet.has(movie.id.toString())
         );
 
         movies.push(...filteredMovies);
@@ -366,6 +367,7 @@ class MovieBatchLoader {
    */
   async fetchPopularMovies(mediaType, excludeIds = [], limit = 60) {
     try {
+      const excludeSet = new Set(excludeIds);
       const endpoint = mediaType === 'MOVIE' ? 'movie' : 'tv';
       const movies = [];
       let page = 1;
@@ -386,7 +388,7 @@ class MovieBatchLoader {
 
         // Filter out excluded movies
         const filteredMovies = pageMovies.filter(movie => 
-          !excludeIds.includes(movie.id.toString())
+          !excludeSet.has(movie.id.toString())
         );
 
         movies.push(...filteredMovies);
@@ -414,10 +416,13 @@ class MovieBatchLoader {
     console.log(`🎯 Applying priority algorithm to ${movies.length} movies`);
 
     try {
+      // Resolve the current year once for the whole batch
+      const currentYear = new Date().getFullYear();
+
       // Calculate priority score for each movie
       const moviesWithPriority = movies.map(movie => ({
         ...movie,
-        priorityScore: this.calculatePriority(movie, criteria)
+        priorityScore: this.calculatePriority(movie, criteria, currentYear)
       }));
 
       // Sort by priority score (higher is better)
@@ -461,9 +466,10 @@ class MovieBatchLoader {
    * Calculates priority score for a movie
    * @param {Object} movie - TMDB movie object
    * @param {Object} criteria - Filter criteria
+   * @param {number} [currentYear] - Reference year for the recency boost
    * @returns {number} Priority score (1-3)
    */
-  calculatePriority(movie, criteria) {
+  calculatePriority(movie, criteria, currentYear = new Date().getFullYear()) {
     let score = 1; // Base priority
 
     // Boost score for genre matches
@@ -495,7 +501,6 @@ class MovieBatchLoader {
 
     // Boost for recent releases (within last 5 years)
     const releaseYear = new Date(movie.release_date || movie.first_air_date).getFullYear();
-    const currentYear = new Date().getFullYear();
     if (currentYear - releaseYear <= 5) {
       score += 0.2;
     }
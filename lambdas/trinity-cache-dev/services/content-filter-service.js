@@ -10,6 +10,11 @@
 
 const axios = require('axios');
 
+/**
+ * BUSINESS LOGIC: Western languages accepted by the quality gate
+ */
+const WESTERN_LANGUAGES = new Set(['en', 'es', 'fr', 'it', 'de', 'pt']);
+
 class ContentFilterService {
   constructor() {
     this.apiKey = process.env.TMDB_API_KEY;
@@ -213,8 +218,7 @@ class ContentFilterService {
     // A. FILTROS BASE (ZERO TOLERANCE - NO OMITIBLES)
     
     // A1. Idioma: original_language debe ser occidental
-    const westernLanguages = ['en', 'es', 'fr', 'it', 'de', 'pt'];
-    if (!westernLanguages.includes(tmdbItem.original_language)) {
+    if (!WESTERN_LANGUAGES.has(tmdbItem.original_language)) {
       console.log(`❌ QUALITY GATE REJECT: Non-western language "${tmdbItem.original_language}" for item ${tmdbItem.id}`);
       return null;
     }
@@ -32,6 +32,11 @@ const GENRE_MAPPING = {
   // Comedy: 35, Drama: 18, Horror: 27, etc.
 };
 
+/**
+ * BUSINESS LOGIC: Western languages accepted by the quality gate
+ */
+const WESTERN_LANGUAGES = new Set(['en', 'es', 'fr', 'it', 'de', 'pt']);
+
 class EnhancedTMDBClient {
   constructor() {
     this.apiKey = process.env.TMDB_API_KEY || '';
@@ -431,8 +436,7 @@ class EnhancedTMDBClient {
     }
 
     // BUSINESS LOGIC: Quality Gate - Western languages only
-    const westernLanguages = ['en', 'es', 'fr', 'it', 'de', 'pt'];
-    if (!item.original_language || !westernLanguages.includes(item.original_language)) {
+    if (!item.original_language || !WESTERN_LANGUAGES.has(item.original_language)) {
       console.warn(`❌ BUSINESS LOGIC REJECTED: Item ${item.id} has non-western language: ${item.original_language}`);
       return false;
     }
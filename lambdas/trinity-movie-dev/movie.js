@@ -978,12 +978,13 @@ async function getFilteredContent(mediaType, genreIds, limit = 30, excludeIds =
         // Load filtered content using the priority algorithm
         const contentPool = await contentService.createFilteredRoom(filterCriteria);
         // Filter out excluded IDs - handle both string and numeric formats
+        const excludeSet = new Set(excludeIds);
+        const idPrefix = `${mediaType.toLowerCase()}-`;
         const filteredContent = contentPool.filter(item => {
             const itemId = item.tmdbId.toString();
-            const prefixedId = `${mediaType.toLowerCase()}-${itemId}`;
             
             // Check if the item is in excludeIds (supports both formats)
-            return !excludeIds.includes(itemId) && !excludeIds.includes(prefixedId);
+            return !excludeSet.has(itemId) && !excludeSet.has(idPrefix + itemId);
         });
         
         console.log(`🧹 Filtered out duplicates: ${contentPool.length} -> ${filteredContent.length} items`);
@@ -12,6 +12,8 @@
  */
 Object.defineProperty(exports, "__esModule", { value: true });
 exports.EnhancedTMDBClient = void 0;
+// Western languages accepted by the discover filter
+const WESTERN_LANGUAGES = new Set(['es', 'en', 'fr', 'it', 'pt', 'de']);
 class EnhancedTMDBClient {
     constructor() {
         this.baseUrl = 'https://api.themoviedb.org/3';
@@ -90,8 +92,7 @@ class EnhancedTMDBClient {
             // SECOND: STRICT Filter by western languages only
             results = results.filter(item => {
                 const originalLang = item.original_language;
-                const westernLanguages = ['es', 'en', 'fr', 'it', 'pt', 'de'];
-                const isWesternLanguage = westernLanguages.includes(originalLang);
+                const isWesternLanguage = WESTERN_LANGUAGES.has(originalLang);
                 
                 if (!isWesternLanguage) {
                     console.log(`❌ TMDB: Filtering out non-western language: ${item.title || item.name} (${originalLang})`);
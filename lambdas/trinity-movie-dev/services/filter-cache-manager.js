@@ -129,7 +129,10 @@ class FilterCacheManager {
         try {
             // Get existing exclusions
             const existingExclusions = await this.getRoomExclusions(roomId);
-            const allExcludedIds = new Set([...existingExclusions, ...contentIds]);
+            const allExcludedIds = new Set(existingExclusions);
+            for (const contentId of contentIds) {
+                allExcludedIds.add(contentId);
+            }
             const exclusionData = {
                 roomId,
                 excludedIds: Array.from(allExcludedIds),
@@ -28,6 +28,12 @@ const GENRE_MAP = {
     10752: 'War',
     37: 'Western',
 };
+// Sorted genre names, computed once since GENRE_MAP never changes
+const AVAILABLE_GENRES = Object.values(GENRE_MAP).sort();
+// Lowercase genre name to TMDB genre ID, for case-insensitive lookups
+const GENRE_IDS_BY_NAME = new Map(Object.entries(GENRE_MAP).map(([id, name]) => [name.toLowerCase(), parseInt(id)]));
+// Lowercase genre name to its properly capitalized display name
+const GENRE_NAMES_BY_LOWERCASE = new Map(AVAILABLE_GENRES.map(name => [name.toLowerCase(), name]));
 /**
  * Circuit Breaker States
  */
@@ -361,16 +367,11 @@ class MovieCacheService {
         const genreIds = [];
         const unmatchedGenres = [];
         for (const name of genreNames) {
-            const normalizedName = name.toLowerCase().trim();
-            let found = false;
-            for (const [id, genreName] of Object.entries(GENRE_MAP)) {
-                if (genreName.toLowerCase() === normalizedName) {
-                    genreIds.push(parseInt(id));
-                    found = true;
-                    break;
-                }
+            const genreId = GENRE_IDS_BY_NAME.get(name.toLowerCase().trim());
+            if (genreId !== undefined) {
+                genreIds.push(genreId);
             }
-            if (!found) {
+            else {
                 unmatchedGenres.push(name);
             }
         }
@@ -384,23 +385,19 @@ class MovieCacheService {
      * Get list of available genres
      */
     getAvailableGenres() {
-        return Object.values(GENRE_MAP).sort();
+        return AVAILABLE_GENRES.slice();
     }
     /**
      * Validate genre names against available genres
      */
     validateGenres(genreNames) {
-        const availableGenres = this.getAvailableGenres().map(g => g.toLowerCase());
         const valid = [];
         const invalid = [];
         for (const genre of genreNames) {
             const normalizedGenre = genre.toLowerCase().trim();
-            if (availableGenres.includes(normalizedGenre)) {
-                // Find the properly capitalized version
-                const properGenre = Object.values(GENRE_MAP).find(g => g.toLowerCase() === normalizedGenre);
-                if (properGenre) {
-                    valid.push(properGenre);
-                }
+            const originalGenre = GENRE_NAMES_BY_LOWERCASE.get(normalizedGenre);
+            if (originalGenre !== undefined) {
+                valid.push(originalGenre);
             }
             else {
                 invalid.push(genre);